@@ -1,19 +1,280 @@
+import difflib
+import operator
 import re
-from typing import Any, List, Optional
+from functools import cached_property, lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+import polars as pl
+
+# pandas' default na_values, so the scan and the pandas frame agree on nulls.
+_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# pandas.api.types.infer_dtype results for columns the pyarrow engine parsed
+# as dates or timestamps.
+_DATETIME_KINDS = {"date", "datetime", "datetime64", "time"}
+
+_CMD_RE = re.compile(r"(\w+)(?:\((.*)\))?\Z")
+_ARG_RE = re.compile(r'\s*(?:"((?:[^"]|"")*)"\s*|([^,"]*?)\s*)(,|\Z)')
+
+_SCALAR_COL_FUNCS = {
+    "mean": lambda c: c.mean(),
+    "median": lambda c: c.median(),
+    "std": lambda c: c.std(),
+    "var": lambda c: c.var(),
+    "sum": lambda c: c.sum(),
+    "max": lambda c: c.max(),
+    "min": lambda c: c.min(),
+    "count": lambda c: c.count(),
+    # pandas' nunique() does not count missing values; Polars' n_unique() does
+    "nunique": lambda c: c.drop_nulls().n_unique(),
+}
+
+
+def _key_matches_scan(key: pd.Series, scan_dtype: Any) -> bool:
+    # The in-memory groupby casts its keys to the scan dtype; only take it when
+    # pandas holds the key in a compatible form (e.g. not parsed dates).
+    dtype = key.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    if scan_dtype == pl.String:
+        if dtype == object:
+            return pd.api.types.infer_dtype(key, skipna=True) in ("string", "empty")
+        return pd.api.types.is_string_dtype(dtype)
+    if scan_dtype.is_numeric() or scan_dtype == pl.Boolean:
+        return dtype.kind in "biuf"
+    return False
+
+
+def _split_args(argstr: str) -> List[str]:
+    # Comma-separated arguments. Unquoted values are stripped; double-quoted
+    # values are kept verbatim (commas and surrounding spaces included, "" is
+    # an escaped quote), e.g. filter(name, ==, "O'Brien, Jr.").
+    args = []
+    pos = 0
+    while True:
+        match = _ARG_RE.match(argstr, pos)
+        if not match:
+            raise ValueError(f"unbalanced or misplaced quote in: {argstr}")
+        quoted, bare, sep = match.groups()
+        args.append(quoted.replace('""', '"') if quoted is not None else bare)
+        if not sep:
+            return args
+        pos = match.end()
+
+
+def _mode(s: pd.Series) -> List[Any]:
+    # Counting with NumPy: bincount over categorical codes, a single sort for
+    # numeric columns. Other dtypes go through pandas.
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(s.cat.categories))
+        return s.cat.categories[counts == counts.max()].tolist() if counts.any() else []
+    if s.dtype.kind in "biuf":
+        arr = s.to_numpy()
+        if arr.dtype.kind == "f":
+            arr = arr[~np.isnan(arr)]
+        vals, counts = np.unique(arr, return_counts=True)
+        return vals[counts == counts.max()].tolist() if counts.size else []
+    return s.mode().tolist()
+
+
+def _unique(s: pd.Series) -> Any:
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        present = np.bincount(codes[codes >= 0], minlength=len(s.cat.categories)) > 0
+        values = s.cat.categories.to_numpy()[present]
+        return np.append(values, np.nan) if (codes < 0).any() else values
+    if s.dtype.kind in "biuf":
+        return np.unique(s.to_numpy())
+    return s.unique()
+
+
+_SINGLE_COL_FUNCS = {
+    "mode": _mode,
+    "unique": _unique,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_plt() -> Any:
+    # matplotlib is only imported by plotting commands, keeping startup fast
+    # for everything else.
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+_FILTER_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+# Below this many cells the host<->device copy costs more than the CPU GEMM.
+_GPU_MIN_CELLS = 10_000_000
+_GROUPBY_AGGS = {"mean", "sum", "min", "max", "count", "median", "std", "var"}
+_BINCOUNT_AGGS = {"mean", "sum", "count"}
 
 
 class DataAnalyzer:
-    def __init__(self, filepath: str):
-        self.df = pd.read_csv(filepath)
-        print("✅ Dataset loaded with columns:", list(self.df.columns))
+    def __init__(self, filepath: str, downcast: bool = False):
+        self._path = filepath
+        self._downcast = downcast
+        # Lazy scan: column projections and predicates are pushed down to the
+        # CSV reader, so most commands only parse the columns they touch, and
+        # queries run on the streaming engine in bounded memory. Types are
+        # inferred from every row, as pandas does, so a late float or string
+        # value cannot break a column guessed from the first few rows. That
+        # inference is a full pass over the file, so it runs once here and the
+        # stored scan is pinned to the result; a scan built with
+        # infer_schema_length=None would redo it on every query.
+        self.schema = pl.scan_csv(
+            filepath, infer_schema_length=None, null_values=_NA_VALUES
+        ).collect_schema()
+        self.lf = pl.scan_csv(filepath, schema=self.schema, null_values=_NA_VALUES)
+        self._colset = frozenset(self.schema.names())
+        # Results of full-frame scans, keyed on (_version, name). The frame is
+        # never mutated today; bump _version if that ever changes.
+        self._version = 0
+        self._cache: Dict[Tuple[int, str], Any] = {}
+        self._factor_cache: Dict[str, Tuple[np.ndarray, Any]] = {}
+        self._dispatch: Dict[str, Callable[[List[str]], Any]] = {
+            "head": self._do_head,
+            "tail": self._do_tail,
+            "info": self._do_info,
+            "describe": self._do_describe,
+            "shape": self._do_shape,
+            "columns": self._do_columns,
+            "dtypes": self._do_dtypes,
+            "missing": self._do_missing,
+            "corr": self._do_corr,
+            "cov": self._do_cov,
+            "value_counts": self._do_value_counts,
+            "groupby": self._do_groupby,
+            "filter": self._do_filter,
+            "plot": self._do_plot,
+            "hist": self._do_hist,
+            "scatter": self._do_scatter,
+            "box": self._do_box,
+            "heatmap": self._do_heatmap,
+        }
+        for name in _SCALAR_COL_FUNCS:
+            self._dispatch[name] = partial(self._do_scalar_col, name)
+        for name in _SINGLE_COL_FUNCS:
+            self._dispatch[name] = partial(self._do_single_col, name)
+        print("✅ Dataset loaded with columns:", self.schema.names())
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        # Full in-memory frame, only materialized for commands that need it
+        # (describe, info, corr, plots, ...).
+        df = pd.read_csv(self._path, engine="pyarrow")
+        # The pyarrow engine parses dates/timestamps on its own, while the scan
+        # keeps them as String. Re-read those few columns as text so both
+        # backends agree. (A dtype= mapping on the full read cannot be used:
+        # the pyarrow engine then fails on integer columns with nulls.)
+        dated = [
+            c
+            for c, dtype in self.schema.items()
+            if dtype == pl.String
+            and pd.api.types.infer_dtype(df[c], skipna=True) in _DATETIME_KINDS
+        ]
+        if dated:
+            df[dated] = pd.read_csv(
+                self._path, engine="pyarrow", usecols=dated, dtype={c: str for c in dated}
+            )
+        # Low-cardinality text columns become categoricals so mode/unique and
+        # equality checks work on integer codes instead of strings.
+        for c in df.select_dtypes(include=["object", "string"]):
+            s = df[c]
+            if s.nunique() / max(len(s), 1) < 0.5:
+                df[c] = s.astype("category")
+        if self._downcast:
+            # Opt-in: smallest int/float dtype that holds the values. Halves the
+            # bytes moved by reductions, at the cost of float32 precision.
+            for c in df.select_dtypes("number"):
+                kind = df[c].dtype.kind
+                df[c] = pd.to_numeric(df[c], downcast="integer" if kind in "iu" else "float")
+        return df
+
+    def _memo(self, key: str, fn: Callable[[], Any]) -> Any:
+        k = (self._version, key)
+        v = self._cache.get(k)
+        return v if v is not None else self._cache.setdefault(k, fn())
+
+    def _centered_matrix(self) -> Tuple[Optional[np.ndarray], bool, List[str]]:
+        # Only the centered float32 matrix is kept: each column is widened to
+        # float64 one at a time, centered with its float64 mean (offset data
+        # keeps its precision) and stored as float32 for the GEMM below. The
+        # flag is True (and no matrix is built) when a column has NaNs.
+        num = self.df.select_dtypes(["number", "bool"])
+        Xc = np.empty((len(num), num.shape[1]), dtype=np.float32)
+        for j, c in enumerate(num.columns):
+            col = num[c].to_numpy(dtype=float)
+            if np.isnan(col).any():
+                return None, True, list(num.columns)
+            Xc[:, j] = col - col.mean()
+        return Xc, False, list(num.columns)
+
+    def _cov_matrix(self) -> Tuple[np.ndarray, List[str]]:
+        Xc, has_nan, cols = self._memo("centered_matrix", self._centered_matrix)
+        if has_nan:
+            # pandas handles missing values with pairwise-complete observations
+            return self.df.select_dtypes(["number", "bool"]).cov().to_numpy(), cols
+        # float32 GEMM: half the bytes and twice the SIMD lanes. The result is
+        # widened back to float64 for display.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = (Xc.T @ Xc) / (len(Xc) - 1)
+        return cov.astype(np.float64), cols
+
+    def _corr_matrix(self) -> Tuple[np.ndarray, List[str]]:
+        Xc, has_nan, cols = self._memo("centered_matrix", self._centered_matrix)
+        if has_nan:
+            return self.df.select_dtypes(["number", "bool"]).corr().to_numpy(), cols
+        if Xc.size > _GPU_MIN_CELLS:
+            corr = self._corr_gpu(Xc)
+            if corr is not None:
+                return corr, cols
+        cov, _ = self._memo("cov", self._cov_matrix)
+        d = np.sqrt(np.diag(cov))
+        corr = np.empty_like(cov)
+        rows, idx = np.tril_indices(len(d))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr[rows, idx] = cov[rows, idx] / (d[rows] * d[idx])
+        corr[idx, rows] = corr[rows, idx]
+        return corr, cols
+
+    def _corr_gpu(self, X: np.ndarray) -> Optional[np.ndarray]:
+        # Optional CuPy offload for wide/long frames; only the small NxN result
+        # is copied back. Returns None when CuPy is missing or the GPU fails.
+        try:
+            import cupy as cp
+        except ImportError:
+            return None
+        try:
+            corr = cp.corrcoef(cp.asarray(X), rowvar=False)
+            return cp.asnumpy(corr).astype(np.float64)
+        except Exception:
+            # no usable device, out of device memory, driver errors, ...:
+            # fall back to the CPU path rather than failing the command
+            return None
+
+    def _get_corr(self) -> Tuple[np.ndarray, List[str]]:
+        return self._memo("corr", self._corr_matrix)
 
     def _validate_columns(self, cols: List[str]) -> Optional[str]:
         for col in cols:
-            if col and col not in self.df.columns:
-                return f"❌ Column '{col}' not found."
+            if col and col not in self._colset:
+                close = difflib.get_close_matches(col, self.schema.names(), n=1)
+                hint = f" Did you mean '{close[0]}'?" if close else ""
+                return f"❌ Column '{col}' not found.{hint}"
         return None
 
     def help_text(self) -> str:
@@ -27,6 +288,11 @@ class DataAnalyzer:
             "- filter(col, op, value)     ops: ==, !=, >, <, >=, <=\n"
             "- plot(col), hist(col), scatter(x, y), box(col), heatmap()\n"
             "- help\n"
+            "Column stats, value_counts, missing, groupby, filter, head/tail and shape\n"
+            "stream the CSV in batches and work on files larger than RAM; describe, info,\n"
+            "corr/cov, mode/unique and plots load the whole file into memory.\n"
+            "Start with downcast=True (CLI: --downcast) to store numeric columns in the\n"
+            "smallest int/float dtype; halves memory, float columns lose precision.\n"
             "Examples: describe(), mean(age), scatter(age, salary), value_counts(department)"
         )
 
@@ -38,170 +304,286 @@ class DataAnalyzer:
         if command == "help":
             return self.help_text()
 
-        match = re.match(r"(\w+)(?:\((.*)\))?$", command)
+        match = _CMD_RE.match(command)
         if not match:
             return f"❌ Invalid command: {command}"
 
         func, argstr = match.groups()
-        args = [] if argstr is None or argstr.strip() == "" else [a.strip() for a in argstr.split(",")]
-
-        if func == "head":
-            n = 5
-            if args:
-                try:
-                    n = int(args[0])
-                except ValueError:
-                    return "❌ head(n) expects integer n"
-            return self.df.head(n)
-        if func == "tail":
-            n = 5
-            if args:
-                try:
-                    n = int(args[0])
-                except ValueError:
-                    return "❌ tail(n) expects integer n"
-            return self.df.tail(n)
-        if func == "info":
+        try:
+            args = [] if argstr is None or argstr.strip() == "" else _split_args(argstr)
+        except ValueError as exc:
+            return f"❌ Invalid arguments: {exc}"
+
+        handler = self._dispatch.get(func)
+        if handler is None:
+            return f"❌ Function '{func}' not supported. Type 'help' for options."
+        try:
+            return handler(args)
+        except (pl.exceptions.PolarsError, ValueError) as exc:
+            # Polars appends the query plan to its messages; keep the summary.
+            return f"❌ {func} failed: {str(exc).splitlines()[0]}"
+
+    def _do_head(self, args: List[str]) -> Any:
+        n = 5
+        if args:
+            try:
+                n = int(args[0])
+            except ValueError:
+                return "❌ head(n) expects integer n"
+        if n < 0:
+            # pandas semantics: every row except the last |n|
+            n = max(self._do_shape([])[0] + n, 0)
+        return self.lf.head(n).collect(engine="streaming")
+
+    def _do_tail(self, args: List[str]) -> Any:
+        n = 5
+        if args:
+            try:
+                n = int(args[0])
+            except ValueError:
+                return "❌ tail(n) expects integer n"
+        if n < 0:
+            # pandas semantics: every row except the first |n|
+            return self.lf.slice(-n).collect(engine="streaming")
+        return self.lf.tail(n).collect(engine="streaming")
+
+    def _do_info(self, args: List[str]) -> Any:
+        def info() -> str:
             import io
             buf = io.StringIO()
             self.df.info(buf=buf)
             return buf.getvalue()
-        if func == "describe":
-            return self.df.describe()
-        if func == "shape":
-            return self.df.shape
-        if func == "columns":
-            return list(self.df.columns)
-        if func == "dtypes":
-            return self.df.dtypes
-        if func == "missing":
-            return self.df.isna().sum()
-        if func == "corr":
-            return self.df.corr(numeric_only=True)
-        if func == "cov":
-            return self.df.cov(numeric_only=True)
-
-        single_col_funcs = {
-            "mean": lambda s: s.mean(),
-            "median": lambda s: s.median(),
-            "mode": lambda s: s.mode().tolist(),
-            "std": lambda s: s.std(),
-            "var": lambda s: s.var(),
-            "sum": lambda s: s.sum(),
-            "max": lambda s: s.max(),
-            "min": lambda s: s.min(),
-            "count": lambda s: s.count(),
-            "unique": lambda s: s.unique(),
-            "nunique": lambda s: s.nunique(),
-            "value_counts": lambda s: s.value_counts(),
-        }
-        if func in single_col_funcs:
-            if len(args) != 1:
-                return f"❌ {func}(col) expects exactly one column"
-            err = self._validate_columns([args[0]])
-            if err:
-                return err
-            return single_col_funcs[func](self.df[args[0]])
-
-        if func == "groupby":
-            if len(args) != 3:
-                return "❌ groupby(group_col, agg, target_col) required"
-            group_col, agg, target_col = args
-            err = self._validate_columns([group_col, target_col])
-            if err:
-                return err
-            if agg not in {"mean", "sum", "min", "max", "count", "median", "std", "var"}:
-                return "❌ Unsupported agg. Use mean,sum,min,max,count,median,std,var"
-            return getattr(self.df.groupby(group_col)[target_col], agg)()
-
-        if func == "filter":
-            if len(args) != 3:
-                return "❌ filter(col, op, value) required"
-            col, op, value = args
-            err = self._validate_columns([col])
-            if err:
-                return err
-            series = self.df[col]
+
+        return self._memo("info", info)
+
+    def _do_describe(self, args: List[str]) -> Any:
+        return self._memo("describe", lambda: self.df.describe())
+
+    def _do_shape(self, args: List[str]) -> Any:
+        return self._memo(
+            "shape",
+            lambda: (self.lf.select(pl.len()).collect(engine="streaming").item(), len(self.schema)),
+        )
+
+    def _do_columns(self, args: List[str]) -> Any:
+        return self.schema.names()
+
+    def _do_dtypes(self, args: List[str]) -> Any:
+        return self.schema
+
+    def _do_missing(self, args: List[str]) -> Any:
+        # One streamed count per column, no N x M boolean mask. The scan reads
+        # pandas' NA tokens as nulls and float columns also count NaN cells,
+        # so this matches pd.read_csv(...).isna().sum().
+        def missing() -> pd.Series:
+            exprs = [
+                (pl.col(c).is_null() | pl.col(c).is_nan()).sum()
+                if dtype.is_float()
+                else pl.col(c).null_count()
+                for c, dtype in self.schema.items()
+            ]
+            counts = self.lf.select(exprs).collect(engine="streaming").row(0, named=True)
+            return pd.Series(counts, dtype="int64")
+
+        return self._memo("missing", missing)
+
+    def _do_corr(self, args: List[str]) -> Any:
+        corr, cols = self._get_corr()
+        return pd.DataFrame(corr, index=cols, columns=cols)
+
+    def _do_cov(self, args: List[str]) -> Any:
+        cov, cols = self._memo("cov", self._cov_matrix)
+        return pd.DataFrame(cov, index=cols, columns=cols)
+
+    def _do_scalar_col(self, func: str, args: List[str]) -> Any:
+        if len(args) != 1:
+            return f"❌ {func}(col) expects exactly one column"
+        err = self._validate_columns([args[0]])
+        if err:
+            return err
+        expr = _SCALAR_COL_FUNCS[func](pl.col(args[0]))
+        return self.lf.select(expr).collect(engine="streaming").item()
+
+    def _do_single_col(self, func: str, args: List[str]) -> Any:
+        if len(args) != 1:
+            return f"❌ {func}(col) expects exactly one column"
+        err = self._validate_columns([args[0]])
+        if err:
+            return err
+        return _SINGLE_COL_FUNCS[func](self.df[args[0]])
+
+    def _do_value_counts(self, args: List[str]) -> Any:
+        if len(args) != 1:
+            return "❌ value_counts(col) expects exactly one column"
+        col = args[0]
+        err = self._validate_columns([col])
+        if err:
+            return err
+        counts = (
+            self.lf.select(pl.col(col).drop_nulls().value_counts(sort=True))
+            .unnest(col)
+            .collect(engine="streaming")
+        )
+        return pd.Series(
+            counts["count"].to_numpy(),
+            index=pd.Index(counts[col].to_list(), name=col),
+            name="count",
+        )
+
+    def _do_groupby(self, args: List[str]) -> Any:
+        if len(args) != 3:
+            return "❌ groupby(group_col, agg, target_col) required"
+        group_col, agg, target_col = args
+        err = self._validate_columns([group_col, target_col])
+        if err:
+            return err
+        if agg not in _GROUPBY_AGGS:
+            return "❌ Unsupported agg. Use mean,sum,min,max,count,median,std,var"
+
+        def groupby() -> pl.DataFrame:
+            out = self._groupby_bincount(group_col, agg, target_col)
+            if out is None:
+                # One lazy query: only the two referenced columns are parsed,
+                # and the hash group-by aggregates as it goes.
+                expr = getattr(pl.col(target_col), agg)()
+                if group_col == target_col:
+                    expr = expr.alias(f"{target_col}_{agg}")
+                # Null keys are dropped, as pandas' groupby does.
+                out = (
+                    self.lf.drop_nulls(group_col)
+                    .group_by(group_col)
+                    .agg(expr)
+                    .sort(group_col)
+                    .collect(engine="streaming")
+                )
+            return out
+
+        # Results are reused per session.
+        return self._memo(f"groupby:{group_col}:{agg}:{target_col}", groupby)
+
+    def _groupby_bincount(self, group_col: str, agg: str, target_col: str) -> Optional[pl.DataFrame]:
+        # Once the pandas frame is in memory, sum/mean/count reuse a cached
+        # factorization of the key and reduce with NumPy instead of rescanning
+        # the file. Only null-free integer targets qualify, so sums are exact
+        # in int64 and the output matches the lazy query. Returns None when
+        # the lazy query should be used.
+        if agg not in _BINCOUNT_AGGS or group_col == target_col or "df" not in self.__dict__:
+            return None
+        target = self.df[target_col]
+        if target.dtype.kind not in "iu" or not self.schema[target_col].is_integer():
+            return None
+        if not _key_matches_scan(self.df[group_col], self.schema[group_col]):
+            return None
+        if group_col not in self._factor_cache:
+            self._factor_cache[group_col] = pd.factorize(self.df[group_col], sort=True)
+        codes, uniques = self._factor_cache[group_col]
+        if (codes < 0).any():
+            # null keys: leave them to the lazy query, which drops them
+            return None
+        counts = np.bincount(codes, minlength=len(uniques))
+        if agg == "count":
+            result = counts.astype(np.uint32)
+        else:
+            sums = np.zeros(len(uniques), dtype=np.int64)
+            np.add.at(sums, codes, target.to_numpy().astype(np.int64, copy=False))
+            result = sums if agg == "sum" else sums / counts
+        keys = pl.Series(group_col, np.asarray(uniques)).cast(self.schema[group_col])
+        return pl.DataFrame([keys, pl.Series(target_col, result)])
+
+    def _do_filter(self, args: List[str]) -> Any:
+        if len(args) != 3:
+            return "❌ filter(col, op, value) required"
+        col, op, value = args
+        err = self._validate_columns([col])
+        if err:
+            return err
+        if op not in _FILTER_OPS:
+            return "❌ Unsupported operator. Use ==, !=, >, <, >=, <="
+        dtype = self.schema[col]
+        value_coerced: Any = value
+        if dtype.is_numeric():
             try:
-                value_coerced: Any = float(value) if series.dtype.kind in "biufc" else value
+                value_coerced = float(value)
             except ValueError:
-                value_coerced = value
-            if op == "==":
-                return self.df[series == value_coerced]
-            if op == "!=":
-                return self.df[series != value_coerced]
-            if op == ">":
-                return self.df[series > value_coerced]
-            if op == "<":
-                return self.df[series < value_coerced]
-            if op == ">=":
-                return self.df[series >= value_coerced]
-            if op == "<=":
-                return self.df[series <= value_coerced]
-            return "❌ Unsupported operator. Use ==, !=, >, <, >=, <="
+                return f"❌ filter on numeric column '{col}' expects a numeric value"
+            else:
+                # Integral literals stay ints so an integer column is compared
+                # in its own dtype instead of being upcast to Float64 first.
+                if dtype.is_integer() and value_coerced.is_integer():
+                    value_coerced = int(value_coerced)
+        predicate = _FILTER_OPS[op](pl.col(col), value_coerced)
+        # The predicate is pushed into the CSV scan, so rows that fail it are
+        # dropped while parsing and never materialized.
+        return self.lf.filter(predicate).collect(engine="streaming")
+
+    def _do_plot(self, args: List[str]) -> Any:
+        plt = _get_plt()
+        if len(args) != 1:
+            return "❌ plot(col) expects one column"
+        err = self._validate_columns([args[0]])
+        if err:
+            return err
+        self.df[args[0]].plot()
+        plt.title(f"Plot of {args[0]}")
+        plt.xlabel(args[0])
+        plt.tight_layout()
+        plt.show()
+        return f"📊 Plot displayed for {args[0]}"
+
+    def _do_hist(self, args: List[str]) -> Any:
+        plt = _get_plt()
+        if len(args) != 1:
+            return "❌ hist(col) expects one column"
+        err = self._validate_columns([args[0]])
+        if err:
+            return err
+        self.df[args[0]].hist()
+        plt.title(f"Histogram of {args[0]}")
+        plt.xlabel(args[0])
+        plt.tight_layout()
+        plt.show()
+        return f"📊 Histogram displayed for {args[0]}"
+
+    def _do_scatter(self, args: List[str]) -> Any:
+        plt = _get_plt()
+        if len(args) != 2:
+            return "❌ scatter(x, y) expects two columns"
+        err = self._validate_columns(args)
+        if err:
+            return err
+        self.df.plot.scatter(x=args[0], y=args[1])
+        plt.title(f"Scatter plot: {args[0]} vs {args[1]}")
+        plt.tight_layout()
+        plt.show()
+        return f"📊 Scatter plot displayed for {args[0]} vs {args[1]}"
+
+    def _do_box(self, args: List[str]) -> Any:
+        plt = _get_plt()
+        if len(args) != 1:
+            return "❌ box(col) expects one column"
+        err = self._validate_columns([args[0]])
+        if err:
+            return err
+        self.df[[args[0]]].plot.box()
+        plt.title(f"Box plot of {args[0]}")
+        plt.tight_layout()
+        plt.show()
+        return f"📊 Box plot displayed for {args[0]}"
 
-        if func == "plot":
-            if len(args) != 1:
-                return "❌ plot(col) expects one column"
-            err = self._validate_columns([args[0]])
-            if err:
-                return err
-            self.df[args[0]].plot()
-            plt.title(f"Plot of {args[0]}")
-            plt.xlabel(args[0])
-            plt.tight_layout()
-            plt.show()
-            return f"📊 Plot displayed for {args[0]}"
-        if func == "hist":
-            if len(args) != 1:
-                return "❌ hist(col) expects one column"
-            err = self._validate_columns([args[0]])
-            if err:
-                return err
-            self.df[args[0]].hist()
-            plt.title(f"Histogram of {args[0]}")
-            plt.xlabel(args[0])
-            plt.tight_layout()
-            plt.show()
-            return f"📊 Histogram displayed for {args[0]}"
-        if func == "scatter":
-            if len(args) != 2:
-                return "❌ scatter(x, y) expects two columns"
-            err = self._validate_columns(args)
-            if err:
-                return err
-            self.df.plot.scatter(x=args[0], y=args[1])
-            plt.title(f"Scatter plot: {args[0]} vs {args[1]}")
-            plt.tight_layout()
-            plt.show()
-            return f"📊 Scatter plot displayed for {args[0]} vs {args[1]}"
-        if func == "box":
-            if len(args) != 1:
-                return "❌ box(col) expects one column"
-            err = self._validate_columns([args[0]])
-            if err:
-                return err
-            self.df[[args[0]]].plot.box()
-            plt.title(f"Box plot of {args[0]}")
-            plt.tight_layout()
-            plt.show()
-            return f"📊 Box plot displayed for {args[0]}"
-        if func == "heatmap":
-            corr = self.df.corr(numeric_only=True)
-            import numpy as np
-            fig, ax = plt.subplots(figsize=(6, 5))
-            cax = ax.imshow(corr.values, cmap="viridis")
-            ax.set_xticks(range(len(corr.columns)))
-            ax.set_yticks(range(len(corr.index)))
-            ax.set_xticklabels(corr.columns, rotation=90)
-            ax.set_yticklabels(corr.index)
-            fig.colorbar(cax)
-            plt.title("Correlation heatmap")
-            plt.tight_layout()
-            plt.show()
-            return "📊 Heatmap displayed"
-
-        return f"❌ Function '{func}' not supported. Type 'help' for options."
+    def _do_heatmap(self, args: List[str]) -> Any:
+        plt = _get_plt()
+        corr, cols = self._get_corr()
+        fig, ax = plt.subplots(figsize=(6, 5))
+        cax = ax.imshow(corr, cmap="viridis")
+        ax.set_xticks(range(len(cols)))
+        ax.set_yticks(range(len(cols)))
+        ax.set_xticklabels(cols, rotation=90)
+        ax.set_yticklabels(cols)
+        fig.colorbar(cax)
+        plt.title("Correlation heatmap")
+        plt.tight_layout()
+        plt.show()
+        return "📊 Heatmap displayed"
 
 
 
@@ -1,16 +1,49 @@
 import argparse
+import atexit
+import os
+import sys
 
 from datatool import DataAnalyzer
 
+try:
+    import readline  # line editing and arrow-key history for the REPL
+except ImportError:  # not available on Windows
+    readline = None
+
+_HISTORY_FILE = os.path.expanduser("~/.datatool_history")
+
+
+def _load_history() -> None:
+    if readline is None:
+        return
+    try:
+        readline.read_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    atexit.register(_save_history)
+
+
+def _save_history() -> None:
+    try:
+        readline.write_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Simple CSV Data Analyzer")
     parser.add_argument("--file", "-f", default="data.csv", help="Path to CSV file")
     parser.add_argument("--cmd", "-c", help="Single command to run, e.g., 'describe()'")
     parser.add_argument("--repl", action="store_true", help="Start interactive command loop")
+    parser.add_argument(
+        "--downcast",
+        action="store_true",
+        help="Store numeric columns in the smallest int/float dtype (less memory, float32 precision)",
+    )
     args = parser.parse_args()
 
-    analyzer = DataAnalyzer(args.file)
+    analyzer = DataAnalyzer(args.file, downcast=args.downcast)
 
     if args.cmd:
         out = analyzer.run(args.cmd)
@@ -18,15 +51,18 @@ def main() -> None:
         return
 
     if args.repl or not args.cmd:
+        _load_history()
         print("Type 'help' to list commands. Press Ctrl+C to exit.")
         try:
             while True:
+                # Output is written unflushed and pushed out once per prompt.
+                sys.stdout.flush()
                 raw = input(">> ").strip()
                 if not raw:
                     continue
                 out = analyzer.run(raw)
-                print(out)
-        except KeyboardInterrupt:
+                sys.stdout.write(f"{out}\n")
+        except (KeyboardInterrupt, EOFError):
             print("\n👋 Goodbye")
 
 
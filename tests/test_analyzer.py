@@ -0,0 +1,244 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from datatool import DataAnalyzer
+
+DATA = str(Path(__file__).resolve().parent.parent / "data.csv")
+
+
+@pytest.fixture
+def nulls_csv(tmp_path):
+    path = tmp_path / "nulls.csv"
+    path.write_text(
+        "key,n,x,big,name,flag,day\n"
+        "a,1,1.5,9007199254740993,x,True,2020-01-01\n"
+        "b,NA,NaN,1,NA,False,2020-01-02\n"
+        "a,3,,0,,True,2020-01-01\n"
+        "b,4,2.5,2,y,False,2020-01-03\n"
+        "a,5,0.5,3,x,False,2020-01-02\n"
+    )
+    return str(path)
+
+
+def _lazy_and_eager(path, command, **kwargs):
+    lazy = DataAnalyzer(path, **kwargs).run(command)
+    analyzer = DataAnalyzer(path, **kwargs)
+    analyzer.df  # materialize the pandas frame so in-memory paths are taken
+    return lazy, analyzer.run(command)
+
+
+@pytest.mark.parametrize("agg", ["sum", "mean", "count"])
+@pytest.mark.parametrize("group_col,target_col", [("department", "salary"), ("age", "sales")])
+@pytest.mark.parametrize("downcast", [False, True])
+def test_groupby_bincount_matches_lazy(agg, group_col, target_col, downcast):
+    lazy, eager = _lazy_and_eager(DATA, f"groupby({group_col}, {agg}, {target_col})", downcast=downcast)
+    assert eager.schema == lazy.schema
+    assert eager.equals(lazy)
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "groupby(key, sum, n)",
+        "groupby(key, mean, n)",
+        "groupby(key, sum, big)",
+        "groupby(key, count, x)",
+        "groupby(key, count, key)",
+        "groupby(n, sum, n)",
+        "groupby(day, sum, big)",
+        "groupby(day, count, big)",
+        "groupby(flag, mean, big)",
+    ],
+)
+def test_groupby_bincount_matches_lazy_with_nulls(nulls_csv, command):
+    lazy, eager = _lazy_and_eager(nulls_csv, command)
+    assert isinstance(lazy, pl.DataFrame)
+    assert eager.schema == lazy.schema
+    assert eager.equals(lazy)
+
+
+def test_groupby_big_int_sum_is_exact(nulls_csv):
+    _, eager = _lazy_and_eager(nulls_csv, "groupby(key, sum, big)")
+    assert eager.filter(pl.col("key") == "a")["big"].item() == 9007199254740996
+
+
+@pytest.mark.parametrize("func", ["cov", "corr"])
+def test_cov_corr_match_pandas(func, nulls_csv):
+    for path in (DATA, nulls_csv):
+        expected = getattr(pd.read_csv(path), func)(numeric_only=True)
+        result = DataAnalyzer(path).run(f"{func}()")
+        assert list(result.columns) == list(expected.columns)
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-5)
+
+
+@pytest.mark.parametrize("func", ["cov", "corr"])
+def test_cov_corr_keep_precision_on_offset_data(func, tmp_path):
+    rng = np.random.default_rng(0)
+    z = rng.normal(size=50_000)
+    df = pd.DataFrame({"a": 1e6 + z, "b": 1e6 + z + 0.5 * rng.normal(size=z.size)})
+    path = tmp_path / "offset.csv"
+    df.to_csv(path, index=False)
+    result = DataAnalyzer(str(path)).run(f"{func}()")
+    np.testing.assert_allclose(result.to_numpy(), getattr(df, func)().to_numpy(), rtol=1e-5)
+
+
+def test_corr_falls_back_to_cpu_when_gpu_fails(monkeypatch):
+    import sys
+    import types
+
+    import datatool.analyzer as analyzer_mod
+
+    class OutOfMemoryError(MemoryError):
+        pass
+
+    def asarray(_):
+        raise OutOfMemoryError("out of device memory")
+
+    cupy = types.SimpleNamespace(asarray=asarray, corrcoef=np.corrcoef, asnumpy=np.asarray)
+    monkeypatch.setitem(sys.modules, "cupy", cupy)
+    monkeypatch.setattr(analyzer_mod, "_GPU_MIN_CELLS", 0)
+    expected = pd.read_csv(DATA).corr(numeric_only=True)
+    result = DataAnalyzer(DATA).run("corr()")
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-5)
+
+
+def test_missing_matches_pandas_isna(nulls_csv):
+    for path in (DATA, nulls_csv):
+        expected = pd.read_csv(path).isna().sum()
+        pd.testing.assert_series_equal(DataAnalyzer(path).run("missing()"), expected)
+
+
+def test_value_counts_skips_na_tokens(nulls_csv):
+    for path, col in ((DATA, "department"), (nulls_csv, "name")):
+        expected = pd.read_csv(path)[col].value_counts()
+        assert DataAnalyzer(path).run(f"value_counts({col})").to_dict() == expected.to_dict()
+
+
+MODE_UNIQUE_CASES = [
+    (DATA, "department"),
+    (DATA, "age"),
+    ("nulls", "key"),
+    ("nulls", "name"),
+    ("nulls", "x"),
+    ("nulls", "n"),
+]
+
+
+def _split_nan(values):
+    values = list(values)
+    present = sorted(v for v in values if not pd.isna(v))
+    return present, len(values) - len(present)
+
+
+@pytest.mark.parametrize("path,col", MODE_UNIQUE_CASES)
+def test_mode_matches_pandas(path, col, nulls_csv):
+    path = nulls_csv if path == "nulls" else path
+    expected = pd.read_csv(path)[col].mode().tolist()
+    assert DataAnalyzer(path).run(f"mode({col})") == expected
+
+
+@pytest.mark.parametrize("path,col", MODE_UNIQUE_CASES)
+def test_unique_matches_pandas(path, col, nulls_csv):
+    path = nulls_csv if path == "nulls" else path
+    expected = pd.read_csv(path)[col].unique()
+    assert _split_nan(DataAnalyzer(path).run(f"unique({col})")) == _split_nan(expected)
+
+
+def test_stored_scan_reuses_inferred_schema(monkeypatch):
+    # Full-file type inference must happen once in the constructor; the scan
+    # kept for queries has to carry the schema so head()/mean() stay cheap.
+    calls = []
+    scan_csv = pl.scan_csv
+
+    def recording_scan_csv(*args, **kwargs):
+        calls.append(kwargs)
+        return scan_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pl, "scan_csv", recording_scan_csv)
+    analyzer = DataAnalyzer(DATA)
+    assert sum(1 for kw in calls if kw.get("infer_schema_length", 100) is None) == 1
+    assert calls[-1].get("schema") == analyzer.schema
+    assert "infer_schema_length" not in calls[-1]
+
+
+@pytest.mark.parametrize("col", ["key", "n", "x", "big", "name"])
+def test_nunique_ignores_missing_values(col, nulls_csv):
+    expected = pd.read_csv(nulls_csv)[col].nunique()
+    assert DataAnalyzer(nulls_csv).run(f"nunique({col})") == expected
+
+
+@pytest.mark.parametrize("agg", ["count", "sum", "mean"])
+def test_groupby_drops_null_keys_like_pandas(agg, nulls_csv):
+    expected = getattr(pd.read_csv(nulls_csv).groupby("name")["n"], agg)()
+    result = DataAnalyzer(nulls_csv).run(f"groupby(name, {agg}, n)")
+    assert result["name"].to_list() == expected.index.tolist()
+    np.testing.assert_allclose(result["n"].to_numpy(), expected.to_numpy())
+
+
+@pytest.fixture
+def dates_csv(tmp_path):
+    path = tmp_path / "dates.csv"
+    path.write_text(
+        "d,t,v\n"
+        "2020-01-01,2020-01-01 10:00:00,1\n"
+        "2020-01-02,NA,2\n"
+        ",2020-01-03 11:00:00,3\n"
+        "2020-01-01,2020-01-01 10:00:00,4\n"
+    )
+    return str(path)
+
+
+@pytest.mark.parametrize("col", ["d", "t"])
+def test_date_columns_stay_strings_in_memory(col, dates_csv):
+    analyzer = DataAnalyzer(dates_csv)
+    expected = pd.read_csv(dates_csv)[col]
+    assert _split_nan(analyzer.run(f"unique({col})")) == _split_nan(expected.unique())
+    assert analyzer.run(f"mode({col})") == expected.mode().tolist()
+
+
+@pytest.mark.parametrize("downcast", [False, True])
+def test_cov_corr_cache_only_centered_float32_matrix(downcast):
+    analyzer = DataAnalyzer(DATA, downcast=downcast)
+    analyzer.run("corr()")
+    analyzer.run("cov()")
+    n_rows = len(analyzer.df)
+    row_matrices = [
+        a
+        for v in analyzer._cache.values()
+        for a in (v if isinstance(v, tuple) else (v,))
+        if isinstance(a, np.ndarray) and a.ndim == 2 and a.shape[0] == n_rows
+    ]
+    assert [m.dtype for m in row_matrices] == [np.float32]
+
+
+@pytest.fixture
+def names_csv(tmp_path):
+    path = tmp_path / "names.csv"
+    path.write_text('name,age\n"Doe, J.",30\nx,41\n" x ",25\nSmith,35\n')
+    return str(path)
+
+
+def test_filter_quoted_value_with_comma(names_csv):
+    result = DataAnalyzer(names_csv).run('filter(name, ==, "Doe, J.")')
+    assert result["name"].to_list() == ["Doe, J."]
+
+
+def test_filter_quoted_value_keeps_inner_whitespace(names_csv):
+    analyzer = DataAnalyzer(names_csv)
+    assert analyzer.run('filter(name, ==, " x ")')["name"].to_list() == [" x "]
+    assert analyzer.run("filter(name, ==,  x )")["name"].to_list() == ["x"]
+
+
+def test_filter_quoted_value_on_numeric_column(names_csv):
+    result = DataAnalyzer(names_csv).run('filter(age, >, "30")')
+    assert result["age"].to_list() == [41, 35]
+
+
+@pytest.mark.parametrize("command", ['filter(name, ==, "Doe)', 'filter(name, ==, Do"e)'])
+def test_unbalanced_quote_is_reported(command, names_csv):
+    result = DataAnalyzer(names_csv).run(command)
+    assert isinstance(result, str) and result.startswith("❌ Invalid arguments")